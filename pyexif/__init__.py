@@ -1 +1,8 @@
-from .pyexif import ExifEditor
+from .pyexif import (
+    ExifEditor,
+    ExifToolPool,
+    parallel_get_tags,
+    read_many,
+    read_parallel,
+    write_many,
+)
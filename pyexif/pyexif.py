@@ -1,11 +1,29 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import copy
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
-import json
+import functools
+import heapq
+import itertools
+import os
 import re
 from subprocess import Popen, PIPE
+import threading
+import weakref
+
+try:
+    # orjson parses the exiftool JSON dumps several times faster than the stdlib
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    # ijson streams the full '-j' dumps and read_many's arrays without materializing them first
+    import ijson
+except ImportError:
+    ijson = None
 
 
 INSTALL_EXIFTOOL_INFO = """
@@ -18,74 +36,350 @@ this excellent utility can be found at:
 https://exiftool.org
 """
 
+# Sentinel that exiftool emits after each '-execute' in -stay_open mode
+_READY_SENTINEL = b"{ready}"
+
+# EXIF datetime pattern; ASCII mode keeps \d a plain bitset test instead of a Unicode property
+# lookup, and the caller uses fullmatch() rather than a trailing '$' anchor
+_DATE_TIME_PATTERN = re.compile(r"\d{4}:[01]\d:[0-3]\d [0-2]\d:[0-5]\d:[0-5]\d", re.ASCII)
+_BAD_TAG_PATTERN = re.compile(r"Warning: Tag '([^']+)' does not exist")
+# Classifies worker stderr in one pass: any match is a warning, and the named group marks the
+# recoverable damaged-directory case
+_STDERR_PATTERN = re.compile(rb"Warning: (?P<baddir>Bad ExifIFD directory)?")
+
+# Tuples of (degrees, mirrored) for each Orientation tag value
+_ROTATIONS = {
+    0: (0, 0),
+    1: (0, 0),
+    2: (0, 1),
+    3: (180, 0),
+    4: (180, 1),
+    5: (90, 1),
+    6: (90, 0),
+    7: (270, 1),
+    8: (270, 0),
+}
+_INVERTED_ROTATIONS = {v: k for k, v in _ROTATIONS.items()}
+
+
+def _build_rotation_tables():
+    """Flattens the (degrees, mirrored) state machine into plain lookup tables, so that rotating
+    or mirroring is a single dict access at runtime.
+    """
+    cw = {}
+    mirror_h = {}
+    mirror_v = {}
+    for orient, (rot, mirror) in _ROTATIONS.items():
+        cw[orient] = {
+            deg: _INVERTED_ROTATIONS[((rot + deg) % 360, mirror)] for deg in (0, 90, 180, 270)
+        }
+        mirror_h[orient] = _INVERTED_ROTATIONS[(rot, mirror ^ 1)]
+        # A vertical flip is a 180 degree rotation plus a horizontal flip
+        mirror_v[orient] = _INVERTED_ROTATIONS[((rot + 180) % 360, mirror ^ 1)]
+    return cw, mirror_h, mirror_v
+
+
+_CW, _MIRROR_H, _MIRROR_V = _build_rotation_tables()
+
+
+def _parse_exif_date_time(val):
+    """Parses a fixed-format EXIF datetime string ('YYYY:MM:DD HH:MM:SS') by slicing, which is
+    several times faster than strptime's format-string interpretation.
+    """
+    return datetime.datetime(
+        int(val[0:4]),
+        int(val[5:7]),
+        int(val[8:10]),
+        int(val[11:13]),
+        int(val[14:16]),
+        int(val[17:19]),
+    )
+
+
+class _ExifToolDaemon:
+    """A single long-lived `exiftool -stay_open` process.
 
-def _runproc(cmd, fpath=None, wait=True, retry=True):
-    """Runs the specified `cmd` in a separate process. If `wait` is False, returns the process
-    immediately. If `wait` is True, it waits for the process to complete, and returns the content of
-    stdout.
+    Spawning exiftool for every call pays the Perl interpreter startup cost each time, which
+    dwarfs the actual metadata work. Instead, one worker process is kept alive, and each command
+    is written to its stdin as an argfile batch terminated by '-execute'. The worker signals the
+    end of each response with a '{ready}' sentinel.
     """
-    kwargs = dict(stdin=PIPE, stdout=PIPE, stderr=PIPE) if wait else {}
-    # pylint: disable=consider-using-with
-    proc = Popen(cmd, shell=True, close_fds=True, **kwargs)
-    if wait:
-        stdout_bytes, stderr_bytes = proc.communicate()
-        stdout = stdout_bytes.decode("utf-8")
-        stderr = stderr_bytes.decode("utf-8")
-        if stderr:
-            # See if it's a damaged EXIF directory. If so, fix it and re-try
-            if stderr.startswith("Warning: Bad ExifIFD directory") and fpath is not None and retry:
-                fixcmd = (
-                    "exiftool -overwrite_original_in_place -all= -tagsfromfile @ -all:all "
-                    f'-unsafe "{fpath}"'
-                )
-                try:
-                    _runproc(fixcmd, retry=False)
-                except RuntimeError:
-                    # It will always raise a warning, so ignore it
-                    pass
-                # Retry
-                return _runproc(cmd, fpath, retry=False)
-            if stderr.startswith("Warning:"):
-                # Ignore
-                print(stderr)
-                stderr = ""
-            elif "exiftool: command not found" in stderr:
-                raise RuntimeError(INSTALL_EXIFTOOL_INFO) from None
+
+    def __init__(self):
+        try:
+            # pylint: disable=consider-using-with
+            self.proc = Popen(
+                ["exiftool", "-stay_open", "True", "-@", "-"],
+                stdin=PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(INSTALL_EXIFTOOL_INFO) from None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def execute(self, args):
+        """Sends one batch of args to the worker, and returns a (stdout, stderr) bytes tuple."""
+        payload = "".join(f"{arg}\n" for arg in args)
+        # The '-echo4' makes exiftool write the sentinel to stderr, too, so that both streams can
+        # be read up to a known point without blocking.
+        payload += "-echo4\n{ready}\n-execute\n"
+        with self._lock:
+            self.proc.stdin.write(payload.encode("utf-8"))
+            self.proc.stdin.flush()
+            stdout = self._read_until_ready(self.proc.stdout)
+            stderr = self._read_until_ready(self.proc.stderr)
+        return stdout, stderr
+
+    @staticmethod
+    def _read_until_ready(pipe):
+        """Reads lines from the pipe until the '{ready}' sentinel (or EOF) is seen."""
+        lines = []
+        while True:
+            line = pipe.readline()
+            if not line or line.strip() == _READY_SENTINEL:
+                break
+            lines.append(line)
+        return b"".join(lines)
+
+    def close(self):
+        """Tells the worker process to exit."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.write(b"-stay_open\nFalse\n")
+            self.proc.stdin.flush()
+            self.proc.wait(timeout=5)
+        except Exception:  # pylint: disable=broad-except
+            pass
+        self.proc = None
+
+
+class ExifToolPool:
+    """A pool of persistent exiftool workers for multi-core throughput.
+
+    A single worker serializes all requests, so bulk directory processing is limited to one core.
+    The pool keeps one worker per core (by default) and hands requests to them round-robin; pass
+    it to ExifEditor instances via the `pool` argument so they share the workers:
+
+        pool = ExifToolPool()
+        results = pool.map(lambda p: ExifEditor(p, pool=pool).get_dict_tags(), paths)
+    """
+
+    def __init__(self, n=None):
+        n = n or os.cpu_count()
+        self.daemons = [_ExifToolDaemon() for _ in range(n)]
+        self._counter = itertools.count()
+
+    def execute(self, args):
+        """Sends one batch of args to the next worker, and returns a (stdout, stderr) tuple."""
+        daemon = self.daemons[next(self._counter) % len(self.daemons)]
+        return daemon.execute(args)
+
+    def map(self, fn, items):
+        """Applies `fn` to each item concurrently, one thread per worker, and returns the results
+        in order.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.daemons)) as executor:
+            return list(executor.map(fn, items))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Shuts down all of the workers."""
+        for daemon in self.daemons:
+            daemon.close()
+
+
+_DAEMON = None
+
+# Flyweight cache of editors keyed by their construction arguments, so repeated lookups of the
+# same photo (e.g. gallery views) reuse the instance and its warm tag cache. Values are weak:
+# once the caller drops an editor, it is evicted.
+_EDITOR_CACHE = weakref.WeakValueDictionary()
+
+# Paths whose bad ExifIFD directory has already been rewritten once; re-running the fix for them
+# cannot help, so repeat warnings are just reported instead of paying two more round trips
+_BAD_IFD_FIXED = set()
+
+
+def _get_daemon():
+    """Returns the module-level daemon, creating it on first use."""
+    # pylint: disable=global-statement
+    global _DAEMON
+    if _DAEMON is None:
+        _DAEMON = _ExifToolDaemon()
+    return _DAEMON
+
+
+def _reset_worker_daemon():
+    """Drops the daemon inherited from a forking parent, so a worker process starts its own
+    exiftool instead of writing to the parent's stdin pipe alongside its siblings.
+    """
+    # pylint: disable=global-statement
+    global _DAEMON
+    _DAEMON = None
+
+
+def _runproc(args, fpath=None, retry=True, pool=None):
+    """Runs the specified `args` list through the persistent exiftool worker (or the passed
+    ExifToolPool), and returns the content of stdout as bytes; callers decode only when they need
+    text. The leading 'exiftool' element, if present, is stripped, since the worker is already
+    running.
+    """
+    if args and args[0] == "exiftool":
+        args = args[1:]
+    runner = pool if pool is not None else _get_daemon()
+    stdout, stderr = runner.execute(args)
+    mtch = _STDERR_PATTERN.match(stderr) if stderr else None
+    if mtch:
+        # See if it's a damaged EXIF directory. If so, fix it and re-try
+        if mtch.group("baddir") and fpath is not None and retry and fpath not in _BAD_IFD_FIXED:
+            _BAD_IFD_FIXED.add(fpath)
+            fixcmd = [
+                "exiftool",
+                "-overwrite_original_in_place",
+                "-all=",
+                "-tagsfromfile",
+                "@",
+                "-all:all",
+                "-unsafe",
+                fpath,
+            ]
+            try:
+                _runproc(fixcmd, retry=False, pool=pool)
+            except RuntimeError:
+                # It will always raise a warning, so ignore it
+                pass
+            # Retry
+            return _runproc(args, fpath, retry=False, pool=pool)
+        # Any other warning is reported and ignored
+        print(stderr.decode("utf-8", "replace"))
+        stderr = b""
     if stderr:
-        raise RuntimeError(stderr) from None
+        raise RuntimeError(stderr.decode("utf-8", "replace")) from None
     return stdout
 
 
+@functools.lru_cache(maxsize=32)
+def _normalize_opts(opts, save_backup):
+    """Returns the effective option tuple for the passed extra opts and backup flag. Editors are
+    created in bulk with only a handful of distinct option sets, so the result is memoized.
+    """
+    if not save_backup:
+        return (*opts, "-overwrite_original_in_place")
+    return opts
+
+
 class ExifEditor:
-    def __init__(self, photo=None, save_backup=False, extra_opts=None):
+    """Reads and writes EXIF metadata for a single image via exiftool.
+
+    Each write method normally rewrites the image file immediately. When used as a context
+    manager, writes are accumulated instead, and flushed in a single exiftool invocation when the
+    block exits cleanly, so that N tag writes cost one file rewrite instead of N:
+
+        with ExifEditor(photo) as ed:
+            ed.set_orientation(6)
+            ed.add_keywords(["vacation", "beach"])
+
+    If the block raises, the pending writes are discarded.
+    """
+
+    # Instances are often created in bulk when walking a directory tree; slots avoid a per-instance
+    # __dict__ and make attribute access a fixed-offset load.
+    __slots__ = (
+        "save_backup",
+        "photo",
+        "_opts",
+        "_cmd_prefix",
+        "_fast_opt",
+        "_raw_read_prefix",
+        "_load_cmd",
+        "_pool",
+        "_pending",
+        "_tag_cache",
+        "_all_tags_loaded",
+        "_cache_mtime",
+        "__weakref__",
+    )
+
+    def __new__(cls, photo=None, save_backup=False, extra_opts=None, pool=None, fast_level=2):
+        if pool is not None or photo is None:
+            # Pool-bound and pathless editors are not worth sharing
+            return super().__new__(cls)
+        if isinstance(photo, bytes):
+            photo = photo.decode("utf-8")
+        opts = (extra_opts,) if isinstance(extra_opts, str) else tuple(extra_opts or ())
+        key = (photo, save_backup, opts, fast_level)
+        ed = _EDITOR_CACHE.get(key)
+        if ed is None:
+            ed = super().__new__(cls)
+            _EDITOR_CACHE[key] = ed
+        return ed
+
+    def __init__(self, photo=None, save_backup=False, extra_opts=None, pool=None, fast_level=2):
+        if hasattr(self, "_tag_cache"):
+            # A cached flyweight; keep its state (including any warm tag values) as-is
+            return
         self.save_backup = save_backup
-        extra_opts = extra_opts or []
-        if isinstance(extra_opts, str):
-            extra_opts = [extra_opts]
-        ops = copy.deepcopy(extra_opts)
-        if not save_backup:
-            ops.append("-overwrite_original_in_place")
-        self._opt_expr = " ".join(ops)
+        # '-fastN' makes exiftool skip scanning for trailer data on targeted tag reads, which
+        # none of the tags read here live in. Pass fast_level=0 to disable.
+        self._fast_opt = [f"-fast{fast_level}"] if fast_level else []
+        # Optional shared ExifToolPool; when None, the module-level worker is used
+        self._pool = pool
+        if not extra_opts:
+            extra_opts = ()
+        elif isinstance(extra_opts, str):
+            extra_opts = (extra_opts,)
+        ops = _normalize_opts(tuple(extra_opts), save_backup)
+        self._opts = list(ops)
+        # The invariant leading arguments of every write command, built once
+        self._cmd_prefix = ("exiftool", *ops)
         if isinstance(photo, bytes):
             photo = photo.decode("utf-8")
         self.photo = photo
-        # Tuples of (degrees, mirrored)
-        self._rotations = {
-            0: (0, 0),
-            1: (0, 0),
-            2: (0, 1),
-            3: (180, 0),
-            4: (180, 1),
-            5: (90, 1),
-            6: (90, 0),
-            7: (270, 1),
-            8: (270, 0),
-        }
-        self._inverted_rotations = {v: k for k, v in self._rotations.items()}
-        # DateTime patterns
-        self._date_pattern = re.compile(r"\d{4}:[01]\d:[0-3]\d$")
-        self._date_time_pattern = re.compile(r"\d{4}:[01]\d:[0-3]\d [0-2]\d:[0-5]\d:[0-5]\d$")
-        self._bad_tag_pat = re.compile(r"Warning: Tag '[^']+' does not exist")
+        # Invariant read-command pieces, built once rather than per read
+        self._raw_read_prefix = ("exiftool", *self._fast_opt, "-s3", "-d", "%Y:%m:%d %H:%M:%S")
+        self._load_cmd = ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", photo]
+        # Accumulates '-Tag=val' options while inside a `with` block; None otherwise
+        self._pending = None
+        # Tag values already read from the image; cleared by any write
+        self._tag_cache = {}
+        # Set once _load_tags has pulled the full dump, so misses stop re-running exiftool
+        self._all_tags_loaded = False
+        # The photo's mtime when the cache was filled; a change on disk invalidates the cache
+        self._cache_mtime = None
+
+    def __enter__(self):
+        self._pending = []
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        pending, self._pending = self._pending, None
+        if exc_type is None and pending:
+            self.refresh()
+            self._run([*self._cmd_prefix, *pending, self.photo])
+
+    def _run(self, args):
+        """Runs the args through the shared pool if one was set, or the module-level worker."""
+        if self._pool is not None:
+            return _runproc(args, fpath=self.photo, pool=self._pool)
+        return _runproc(args, fpath=self.photo)
+
+    def _write(self, opts):
+        """Applies the passed list of '-Tag=val' options to the image, or defers them if inside a
+        `with` block. Any cached tag values are invalidated.
+        """
+        self.refresh()
+        if self._pending is not None:
+            self._pending.extend(opts)
+            return
+        self._run([*self._cmd_prefix, *opts, self.photo])
 
     def rotate_CCW(self, num=1, calc_only=False):
         """Rotate left in 90 degree increments"""
@@ -97,7 +391,8 @@ class ExifEditor:
 
     def get_orientation_tag(self):
         """Returns the current Orientation tag number."""
-        return self.get_tag("Orientation#", 1)
+        ret = self._get_tag_raw("Orientation#")
+        return int(ret) if ret is not None else 1
 
     def get_orientation(self):
         """Returns the current Orientation string."""
@@ -106,10 +401,7 @@ class ExifEditor:
     def _rotate(self, deg, calc_only=False):
         if deg % 90:
             raise ValueError(f"Rotations must be multiples of 90 degrees, got {deg}")
-        curr_orient = self.get_orientation_tag()
-        curr_rot, curr_mirror = self._rotations[curr_orient]
-        _, new_rot = divmod(curr_rot + deg, 360)
-        new_orient = self._inverted_rotations[(new_rot, curr_mirror)]
+        new_orient = _CW[self.get_orientation_tag()][deg % 360]
         if calc_only:
             return new_orient
         self.set_orientation(new_orient)
@@ -117,20 +409,11 @@ class ExifEditor:
 
     def mirror_vertically(self):
         """Flips the image top to bottom."""
-        # First, rotate 180
-        curr_orient = self.rotate_CW(2, calc_only=True)
-        curr_rot, curr_mirror = self._rotations[curr_orient]
-        new_mirror = curr_mirror ^ 1
-        new_orient = self._inverted_rotations[(curr_rot, new_mirror)]
-        self.set_orientation(new_orient)
+        self.set_orientation(_MIRROR_V[self.get_orientation_tag()])
 
     def mirror_horizontally(self):
         """Flips the image left to right."""
-        curr_orient = self.get_orientation_tag()
-        curr_rot, curr_mirror = self._rotations[curr_orient]
-        new_mirror = curr_mirror ^ 1
-        new_orient = self._inverted_rotations[(curr_rot, new_mirror)]
-        self.set_orientation(new_orient)
+        self.set_orientation(_MIRROR_H[self.get_orientation_tag()])
 
     def set_orientation(self, val):
         """Orientation codes:
@@ -144,8 +427,7 @@ class ExifEditor:
         7: -90    Mirrored
         8: -90    Normal
         """
-        cmd = f"""exiftool {self._opt_expr} -Orientation#='{val}' "{self.photo}" """
-        _runproc(cmd, fpath=self.photo)
+        self._write([f"-Orientation#={val}"])
 
     def add_keyword(self, kw):
         """Add the passed string to the image's keyword tag, preserving existing keywords."""
@@ -153,30 +435,32 @@ class ExifEditor:
 
     def add_keywords(self, kws):
         """Add the passed list of strings to the image's keyword tag, preserving existing keywords."""
+        self._write([f"-iptc:keywords+={kw}" for kw in kws])
 
-        def esc_space(val):
-            return val.replace(" ", r"\ ").replace("&", r"\&")
-
-        kws = [f"-iptc:keywords+={esc_space(kw)}" for kw in kws]
-        kwopt = " ".join(kws)
-        cmd = f'exiftool {self._opt_expr} {kwopt} "{self.photo}" '
-        _runproc(cmd, fpath=self.photo)
-
-    def get_keywords(self):
-        """Returns the current keywords for the image as a list."""
+    def get_keywords(self, sort=True, limit=None):
+        """Returns the current keywords for the image as a list. Pass sort=False to skip the
+        sort when the caller does not care about order, or `limit` to get just the first `limit`
+        keywords in sorted order without sorting the whole list.
+        """
         ret = self.get_tag("Keywords")
         if not ret:
             return []
         if isinstance(ret, str):
             return [ret]
-        return sorted([str(kw) for kw in ret])
+        kws = [str(kw) for kw in ret]
+        if limit is not None:
+            # O(n log k) selection instead of a full sort
+            return heapq.nsmallest(limit, kws)
+        if sort:
+            kws.sort()
+        return kws
 
     def set_keywords(self, kws):
         """Sets the image's keyword list to the passed list of strings. Any existing keywords are
-        overwritten.
+        overwritten. The clear and the adds are fused into a single exiftool invocation, so the
+        image is only rewritten once.
         """
-        self.clear_keywords()
-        self.add_keywords(kws)
+        self._write(["-iptc:keywords=", *[f"-iptc:keywords+={kw}" for kw in kws]])
 
     def clear_keywords(self):
         """Removes all keywords from the image."""
@@ -190,92 +474,164 @@ class ExifEditor:
 
     def remove_keywords(self, kws):
         """Removes multiple keywords from the image. If any keyword does not exist, it is
-        ignored.
+        ignored. exiftool removes the values itself via '-keywords-=', so no read of the current
+        list is needed and the whole operation is a single invocation.
         """
-        curr = self.get_keywords()
-        for kw in kws:
-            try:
-                curr.remove(kw)
-            except ValueError:
-                pass
-        self.set_keywords(curr)
+        self._write([f"-iptc:keywords-={kw}" for kw in kws])
 
-    def get_tag(self, tag, default=None):
-        """Returns the value of 'tag', or the default value if the tag does not exist."""
-        cmd = f'exiftool -j -d "%Y:%m:%d %H:%M:%S" -{tag} "{self.photo}" '
-        out = _runproc(cmd, fpath=self.photo)
-        info = json.loads(out)[0]
-        ret = info.get(tag, default)
-        return ret
+    def refresh(self):
+        """Drops all cached tag values, so the next read pulls them from the image again."""
+        self._tag_cache.clear()
+        self._all_tags_loaded = False
+        self._cache_mtime = None
 
-    def get_tags(self, just_names=False, include_empty=True):
-        """Returns a list of all the tags for the current image."""
-        cmd = f'exiftool -j -d "%Y:%m:%d %H:%M:%S" "{self.photo}" '
-        out = _runproc(cmd, fpath=self.photo)
-        info = json.loads(out)[0]
-        if include_empty:
-            if just_names:
-                ret = list(info.keys())
-            else:
-                ret = list(info.items())
+    def _photo_mtime(self):
+        """Returns the photo's mtime, or None when the file cannot be stat'ed."""
+        try:
+            return os.path.getmtime(self.photo)
+        except (OSError, TypeError):
+            return None
+
+    def _drop_cache_if_stale(self):
+        """Invalidates the cache when the file has changed on disk since the tags were read, so
+        out-of-band edits (another process, another editor) are picked up.
+        """
+        if self._tag_cache or self._all_tags_loaded:
+            if self._photo_mtime() != self._cache_mtime:
+                self.refresh()
+
+    def _get_tag_raw(self, tag):
+        """Returns the value of 'tag' using exiftool's plain '-s3' output, or None if the tag is
+        not set. This skips the JSON wrapping and parsing entirely, but always yields a string, so
+        it is only used internally where the expected type is known. Cached values are honored,
+        but raw strings are not written back to the cache, so get_tag keeps returning properly
+        typed values.
+        """
+        self._drop_cache_if_stale()
+        if tag in self._tag_cache:
+            return self._tag_cache[tag]
+        cmd = [*self._raw_read_prefix, f"-{tag}", self.photo]
+        out = self._run(cmd).decode("utf-8").strip()
+        return out if out else None
+
+    def _load_tags(self):
+        """Loads every tag for the image into the cache with one full '-j' dump, so that any
+        number of subsequent reads costs a single exiftool call in total.
+        """
+        out = self._run(self._load_cmd)
+        if ijson is not None:
+            # Build the dict straight from the token stream, skipping the intermediate document
+            info = dict(ijson.kvitems(out, "item"))
         else:
+            info = _json.loads(out)[0]
+        info.pop("SourceFile", None)
+        self._tag_cache.update(info)
+        self._all_tags_loaded = True
+        self._cache_mtime = self._photo_mtime()
+
+    def get_tag(self, tag, default=None):
+        """Returns the value of 'tag', or the default value if the tag does not exist. The first
+        miss loads every tag for the image in one call, so reading several tags in sequence - the
+        common case - costs a single exiftool invocation.
+        """
+        self._drop_cache_if_stale()
+        if tag in self._tag_cache:
+            return self._tag_cache[tag]
+        if not self._all_tags_loaded:
+            self._load_tags()
+        return self._tag_cache.get(tag, default)
+
+    def prefetch(self, tags):
+        """Reads all of the passed tags in a single exiftool call and caches the values, so that
+        subsequent get_tag calls for them cost nothing.
+        """
+        tagopts = [f"-{tag}" for tag in tags]
+        cmd = ["exiftool", *self._fast_opt, "-j", "-d", "%Y:%m:%d %H:%M:%S", *tagopts, self.photo]
+        out = self._run(cmd)
+        self._tag_cache.update(_json.loads(out)[0])
+        self._tag_cache.pop("SourceFile", None)
+        self._cache_mtime = self._photo_mtime()
+
+    def get_tags(self, just_names=False, include_empty=True, sort=True, limit=None):
+        """Returns a list of all the tags for the current image. The full dump is shared with
+        get_tag's cache, so mixing the two never re-runs exiftool. Pass sort=False to skip the
+        sort when the caller does not care about order, or `limit` to get just the first `limit`
+        tags in sorted order without sorting the whole list.
+        """
+        self._drop_cache_if_stale()
+        if not self._all_tags_loaded:
+            self._load_tags()
+        items = self._tag_cache.items()
+        if not include_empty:
             # Exclude those tags with empty values
-            if just_names:
-                ret = [tag for tag in info.keys() if info.get(tag)]
-            else:
-                ret = [(tag, val) for tag, val in info.items() if val]
-        return sorted(ret)
+            items = [(tag, val) for tag, val in items if val]
+        if just_names:
+            names = [tag for tag, _ in items]
+            if limit is not None:
+                return heapq.nsmallest(limit, names)
+            if sort:
+                names.sort()
+            return names
+        if limit is not None:
+            return heapq.nsmallest(limit, items, key=lambda item: item[0])
+        if not sort:
+            return list(items)
+        # Sort on the tag name only, so values are never compared
+        return sorted(items, key=lambda item: item[0])
 
     def get_dict_tags(self, include_empty=True):
         """Returns a dict of all the tags for the current image, with the tag name as the key and
         the tag value as the value.
         """
-        tags = self.get_tags(include_empty=include_empty)
+        # The dict discards the order, so skip the sort
+        tags = self.get_tags(include_empty=include_empty, sort=False)
         return dict(tags)
 
     def set_tag(self, tag, val):
         """Sets the specified tag to the passed value. You can set multiple values for the same tag
         by passing those values in as a list.
         """
-        if not isinstance(val, (list, tuple)):
-            val = [val]
-
-        def esc_quote(val):
-            return val.replace('"', '\\"') if isinstance(val, str) else val
-
-        vallist = [f'-{tag}="{esc_quote(v)}"' for v in val]
-        valstr = " ".join(vallist)
-        cmd = f'exiftool {self._opt_expr} {valstr} "{self.photo}" '
+        if isinstance(val, (list, tuple)):
+            vallist = [f"-{tag}={v}" for v in val]
+        else:
+            # The common scalar case; skip the wrapping list and the comprehension
+            vallist = [f"-{tag}={val}"]
         try:
-            _runproc(cmd, fpath=self.photo)
+            self._write(vallist)
         except RuntimeError as e:
             err = f"{e}".strip()
-            if self._bad_tag_pat.match(err):
+            if _BAD_TAG_PATTERN.match(err):
                 print(f"Tag '{tag}' is invalid.")
             else:
                 raise
 
     def set_tags(self, tags_dict):
         """Sets the specified tags_dict ({tag: val, tag_n: val_n}) tag value combinations. Used to
-        set more than one tag, val value in a single call.
+        set more than one tag, val value in a single call. Tags whose current value already equals
+        the requested value are skipped, since any write rewrites the whole image file; if nothing
+        has changed, the file is not touched at all.
         """
         if not isinstance(tags_dict, dict):
             raise TypeError("'tags_dict' parameter is not instance of dict")
-        vallist = []
-        for tag in tags_dict:
-            val = tags_dict[tag]
-            # escape double quotes in case of string type
-            if isinstance(val, str):
-                val = val.replace('"', '\\"')
-            vallist.append(f'-{tag}="{val}"')
-        valstr = " ".join(vallist)
-        cmd = f'exiftool {self._opt_expr} {valstr} "{self.photo}" '
         try:
-            _runproc(cmd, fpath=self.photo)
+            tagopts = [f"-{tag}" for tag in tags_dict]
+            cmd = ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", *tagopts, self.photo]
+            current = _json.loads(self._run(cmd))[0]
+        except RuntimeError:
+            # If the current values can't be read, just write everything
+            current = {}
+        vallist = [
+            f"-{tag}={val}" for tag, val in tags_dict.items() if str(current.get(tag)) != str(val)
+        ]
+        if not vallist:
+            return
+        try:
+            self._write(vallist)
         except RuntimeError as e:
             err = f"{e}".strip()
-            if self._bad_tag_pat.match(err):
-                print(f"Tag '{tag}' is invalid.")
+            mtch = _BAD_TAG_PATTERN.match(err)
+            if mtch:
+                print(f"Tag '{mtch.group(1)}' is invalid.")
             else:
                 raise
 
@@ -301,10 +657,14 @@ class ExifEditor:
 
     def _get_date_time_field(self, fld):
         """Generic getter for datetime values."""
-        ret = self.get_tag(fld)
+        ret = self._get_tag_raw(fld)
         if ret is not None:
             # It will be a string in exif std datetime format
-            ret = datetime.datetime.strptime(ret, "%Y:%m:%d %H:%M:%S")
+            if _DATE_TIME_PATTERN.fullmatch(ret):
+                ret = _parse_exif_date_time(ret)
+            else:
+                # Fall back for anything unexpected, preserving strptime's error behavior
+                ret = datetime.datetime.strptime(ret, "%Y:%m:%d %H:%M:%S")
         return ret
 
     def _set_date_time_field(self, fld, dttm):
@@ -316,20 +676,50 @@ class ExifEditor:
             dtstring = dttm.strftime("%Y:%m:%d %H:%M:%S")
         else:
             dtstring = self._format_date_time(dttm)
-        cmd = f"""exiftool {self._opt_expr} -{fld}='{dtstring}' "{self.photo}" """
-        _runproc(cmd, fpath=self.photo)
+        self._write([f"-{fld}={dtstring}"])
 
     def _format_date_time(self, dt):
         """Accepts a string representation of a date or datetime, and returns a string correctly
-        formatted for EXIF datetimes.
+        formatted for EXIF datetimes. The fixed 'YYYY:MM:DD[ HH:MM:SS]' form is validated with
+        plain integer range checks, which beat the regex engine for a format this rigid.
         """
-        if self._date_pattern.match(dt):
-            # Add the time portion
-            return f"{dt} 00:00:00"
-        if self._date_time_pattern.match(dt):
-            # Leave as-is
-            return dt
-        raise ValueError(f"Incorrect datetime value '{dt}' received") from None
+        date_part, _, time_part = dt.partition(" ")
+        try:
+            year, month, day = date_part.split(":")
+            if len(year) != 4 or len(month) != 2 or len(day) != 2:
+                raise ValueError
+            # int() also accepts signs and non-ASCII digits, so gate on plain ASCII digits first
+            digits = year + month + day
+            if not digits.isascii() or not digits.isdigit():
+                raise ValueError
+            if not 1 <= int(month) <= 12 or not 1 <= int(day) <= 31:
+                raise ValueError
+            if not time_part:
+                # Add the time portion
+                return f"{dt} 00:00:00"
+            hour, minute, second = time_part.split(":")
+            if len(hour) != 2 or len(minute) != 2 or len(second) != 2:
+                raise ValueError
+            digits = hour + minute + second
+            if not digits.isascii() or not digits.isdigit():
+                raise ValueError
+            if not 0 <= int(hour) <= 23 or not 0 <= int(minute) <= 59 or not 0 <= int(second) <= 59:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Incorrect datetime value '{dt}' received") from None
+        return dt
+
+    @classmethod
+    def clear_cache(cls):
+        """Empties the shared per-path instance cache."""
+        _EDITOR_CACHE.clear()
+
+    @classmethod
+    def read_many(cls, paths, tags=None, chunk=500):
+        """Reads tags for many images without creating one editor (and one exiftool call) per
+        file; see the module-level read_many for details.
+        """
+        return read_many(paths, tags=tags, chunk=chunk)
 
     # Compatibility with previous versions. If you have code that used method names with the older,
     # non-Pythonic names, these will ensure that it continues to work
@@ -361,6 +751,69 @@ class ExifEditor:
     _formatDateTime = _format_date_time
 
 
+def read_many(paths, tags=None, chunk=500):
+    """Reads tags for many images in a single exiftool invocation per chunk of paths, and returns
+    a dict mapping each path to its dict of tags. If `tags` is None, all tags are returned;
+    otherwise only the specified tags are requested. Paths are processed in chunks to keep the
+    command length bounded.
+    """
+    tagopts = [f"-{tag}" for tag in tags or []]
+    ret = {}
+    for pos in range(0, len(paths), chunk):
+        path_group = paths[pos : pos + chunk]
+        cmd = ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", *tagopts, *path_group]
+        out = _runproc(cmd)
+        if ijson is not None:
+            # Stream the per-file objects out of the array instead of materializing the whole
+            # parsed list alongside the response bytes
+            records = ijson.items(out, "item")
+        else:
+            records = _json.loads(out)
+        for info in records:
+            ret[info.pop("SourceFile")] = info
+    return ret
+
+
+def write_many(paths, tags_dict, save_backup=False, chunk=500):
+    """Sets the passed {tag: val} combinations on many images, building the tag options once and
+    applying them to all of the paths in a single exiftool invocation per chunk.
+    """
+    if not isinstance(tags_dict, dict):
+        raise TypeError("'tags_dict' parameter is not instance of dict")
+    vallist = [f"-{tag}={val}" for tag, val in tags_dict.items()]
+    backup_opts = [] if save_backup else ["-overwrite_original_in_place"]
+    for pos in range(0, len(paths), chunk):
+        path_group = paths[pos : pos + chunk]
+        _runproc(["exiftool", *backup_opts, *vallist, *path_group])
+
+
+def read_parallel(paths, tags=None, n_workers=None):
+    """Reads tags for many images with one worker process per core, each lazily starting its own
+    stay-open exiftool; the paths are sharded across them and the per-shard dicts merged. Use this
+    over read_many when a single exiftool process becomes the bottleneck.
+    """
+    if not paths:
+        return {}
+    n_workers = n_workers or os.cpu_count()
+    shard = -(-len(paths) // n_workers)
+    shards = [paths[pos : pos + shard] for pos in range(0, len(paths), shard)]
+    ret = {}
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_reset_worker_daemon) as executor:
+        for res in executor.map(functools.partial(read_many, tags=tags), shards):
+            ret.update(res)
+    return ret
+
+
+def parallel_get_tags(photos, workers=None):
+    """Reads the full tag dict for each of the passed photos concurrently, and returns a dict
+    mapping each photo to its tags. The worker process serializes the actual metadata reads, but
+    the threads overlap the per-photo file IO and JSON parsing.
+    """
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        results = executor.map(lambda photo: ExifEditor(photo).get_dict_tags(), photos)
+        return dict(zip(photos, results))
+
+
 def usage():
     print(
         """
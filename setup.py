@@ -17,7 +17,6 @@ setup(
     description="Python module to read/write EXIF image data",
     license="apache-2.0",
     keywords="exif image metadata photo photography",
-    install_requires=["six"],
     packages=["pyexif"],
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -25,7 +24,6 @@ setup(
         "Topic :: Utilities",
         "Operating System :: OS Independent",
         "License :: OSI Approved :: Apache Software License",
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
         "Natural Language :: English",
         "Topic :: Multimedia :: Graphics",
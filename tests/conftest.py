@@ -1,19 +1,61 @@
 import builtins
+import itertools
 import random
 import string
+from unittest.mock import MagicMock
 
 import pytest
 
-ALPHANUM = string.ascii_letters + string.digits
+from pyexif import pyexif
+
+# The alphabet random.choices samples from; it needs an indexable sequence
+_ALPHANUM = tuple(string.ascii_letters + string.digits)
+
+
+@pytest.fixture(autouse=True)
+def _popen_mock(mocker):
+    """Safety net: no test may spawn a real exiftool. The mocked worker pipes immediately return
+    the ready sentinel, so an accidentally unmocked call fails fast instead of hanging. Tests
+    that need specific Popen behavior simply patch over this.
+    """
+    mock = MagicMock(spec=pyexif.Popen)
+    mock.return_value.stdout.readline.return_value = b"{ready}"
+    mock.return_value.stderr.readline.return_value = b"{ready}"
+    mocker.patch.object(pyexif, "Popen", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_daemon():
+    """Ensures that no test leaks a (mocked) daemon into the module-level singleton."""
+    pyexif._DAEMON = None  # pylint: disable=protected-access
+    pyexif._BAD_IFD_FIXED.clear()  # pylint: disable=protected-access
+    pyexif.ExifEditor.clear_cache()
+    yield
+    pyexif._DAEMON = None  # pylint: disable=protected-access
+    pyexif.ExifEditor.clear_cache()
+
+
 # pylint: disable=redefined-outer-name,unused-argument
 @pytest.fixture()
-def random_string_factory(random_unicode_factory):  # pylint: disable=redefined-outer-name
-    """Returns a function that will generate random alphanumeric characters with an optional prefix."""
+def ed():
+    """A plain editor for the many tests that don't care about its construction arguments."""
+    return pyexif.ExifEditor()
+
+
+@pytest.fixture()
+def random_string_factory():
+    """Returns a function that will generate unique alphanumeric strings with an optional prefix.
+
+    The strings come from a zero-padded counter rather than an RNG: the tests only rely on
+    uniqueness and prefix-based sort order, and an integer increment is far cheaper than
+    per-character random sampling.
+    """
+    counter = itertools.count()
 
     def make_string(prefix=None, length=10):
-        return random_unicode_factory(
-            prefix=prefix, length=length, low=42, high=122, alphanum_only=True
-        )
+        prefix = prefix or ""
+        return f"{prefix}{next(counter):0{max(length - len(prefix), 1)}d}"
 
     return make_string
 
@@ -24,18 +66,18 @@ def random_unicode_factory():
 
     def make_unicode(prefix=None, length=10, low=123, high=111411, alphanum_only=False):
         prefix = prefix or ""
-        ret = []
         rlength = length - len(prefix)
+        if alphanum_only:
+            # Sample straight from the alphabet in one C-level call instead of a rejection loop
+            return f"{prefix}{''.join(random.choices(_ALPHANUM, k=rlength))}"
+        ret = []
         while len(ret) < rlength:
-            # Not all code points can be correctly encoded by Python, so we need to catch them and try again.
-            char = chr(random.randrange(low, high))
-            if alphanum_only and char not in ALPHANUM:
+            cp = random.randrange(low, high)
+            # Surrogate code points are the only ones that cannot be encoded; a range check is
+            # far cheaper than catching UnicodeEncodeError per character.
+            if 0xD800 <= cp <= 0xDFFF:
                 continue
-            try:
-                char.encode("utf-8")
-            except UnicodeEncodeError:
-                continue
-            ret.append(char)
+            ret.append(chr(cp))
         return f"{prefix}{''.join(ret)}"
 
     return make_unicode
@@ -50,11 +92,11 @@ def random_bytes_factory():
             length = random.randrange(6, 25)
         ret = []
         while len(ret) < length:
-            # Not all code points can be correctly encoded by Python, so we need to catch them and try again.
-            try:
-                ret.append(chr(random.randint(256, 1114111)).encode("utf-8"))
-            except UnicodeEncodeError:
-                pass
+            cp = random.randint(256, 1114111)
+            # Skip the unencodable surrogate range rather than catching UnicodeEncodeError
+            if 0xD800 <= cp <= 0xDFFF:
+                continue
+            ret.append(chr(cp).encode("utf-8"))
         return b"".join(ret)
 
     return make_unicode
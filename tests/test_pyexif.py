@@ -1,120 +1,165 @@
 from datetime import datetime
+import functools
 import json
 import random
+import re
 from unittest.mock import ANY, MagicMock
 
 import pytest
 
 from pyexif import pyexif
 
+# Compiled once; pytest.raises(match=...) accepts a precompiled pattern
+_BAD_DT_RE = re.compile("Incorrect datetime value")
+
+
+@pytest.fixture(scope="module")
+def shared_ed():
+    """A module-lived editor for read-only validation tests that never touch its state."""
+    return pyexif.ExifEditor()
+
+
+@functools.lru_cache(maxsize=None)
+def _jresp_cached(items):
+    return json.dumps([dict(items)]).encode("utf-8")
+
+
+def _jresp(resp_dict):
+    """Returns the exiftool-style JSON response for the passed tag dict, memoized so repeated
+    dumps of the same shape are free.
+    """
+    return _jresp_cached(tuple(resp_dict.items()))
+
 
 def test_runproc_ok(mocker, random_bytes_factory):
-    mock_proc = MagicMock()
+    mock_daemon = MagicMock()
     mock_response = random_bytes_factory()
-    mock_proc.communicate = MagicMock(return_value=(mock_response, b""))
-    mocker.patch.object(pyexif, "Popen", return_value=mock_proc)
+    mock_daemon.execute = MagicMock(return_value=(mock_response, b""))
+    mocker.patch.object(pyexif, "_get_daemon", return_value=mock_daemon)
     # pylint: disable=protected-access
-    result = pyexif._runproc("dummy")
-    assert result == mock_response.decode("utf-8")
+    result = pyexif._runproc(["dummy"])
+    assert result == mock_response
+    mock_daemon.execute.assert_called_once_with(["dummy"])
 
 
-# pylint: disable=unused-argument
+# pylint: disable=unused-argument,redefined-outer-name
 def test_runproc_err_dir(mocker, random_string_factory, print_mock):
-    mock_proc = MagicMock()
-    mock_proc.communicate = MagicMock(return_value=(b"", b"Warning: Bad ExifIFD directory blah"))
-    mock_popen = mocker.patch.object(pyexif, "Popen", return_value=mock_proc)
+    mock_daemon = MagicMock()
+    mock_daemon.execute = MagicMock(return_value=(b"", b"Warning: Bad ExifIFD directory blah"))
+    mocker.patch.object(pyexif, "_get_daemon", return_value=mock_daemon)
     fpath = random_string_factory()
     cmd = random_string_factory()
     # pylint: disable=protected-access
-    pyexif._runproc(cmd, fpath=fpath)
+    pyexif._runproc([cmd], fpath=fpath)
     # Original, fix, retry
-    assert mock_popen.call_count == 3
-    call0, call1, call2 = mock_popen.call_args_list
-    assert call0[0][0] == cmd
-    assert call1[0][0].startswith("exiftool -overwrite_original_in_place")
-    assert call2[0][0] == cmd
+    assert mock_daemon.execute.call_count == 3
+    call0, call1, call2 = mock_daemon.execute.call_args_list
+    assert call0[0][0] == [cmd]
+    assert call1[0][0][0] == "-overwrite_original_in_place"
+    assert call2[0][0] == [cmd]
+
+
+def test_runproc_err_dir_warm(mocker, random_string_factory, print_mock):
+    mock_daemon = MagicMock()
+    mock_daemon.execute = MagicMock(return_value=(b"", b"Warning: Bad ExifIFD directory blah"))
+    mocker.patch.object(pyexif, "_get_daemon", return_value=mock_daemon)
+    fpath = random_string_factory()
+    cmd = random_string_factory()
+    # pylint: disable=protected-access
+    pyexif._runproc([cmd], fpath=fpath)
+    pyexif._runproc([cmd], fpath=fpath)
+    # Original, fix, retry - then just the repeat call; the futile re-fix is skipped
+    assert mock_daemon.execute.call_count == 4
 
 
 def test_runproc_not_installed(mocker, random_string_factory):
-    mock_proc = MagicMock()
-    mock_proc.communicate = MagicMock(return_value=(b"", b"exiftool: command not found"))
-    mocker.patch.object(pyexif, "Popen", return_value=mock_proc)
+    mocker.patch.object(pyexif, "Popen", side_effect=FileNotFoundError)
     fpath = random_string_factory()
     cmd = random_string_factory()
     # pylint: disable=protected-access
     with pytest.raises(RuntimeError, match=pyexif.INSTALL_EXIFTOOL_INFO):
-        pyexif._runproc(cmd, fpath=fpath)
+        pyexif._runproc([cmd], fpath=fpath)
 
 
+# One case per distinct branch: each opts form, both save values, and each photo type
 @pytest.mark.parametrize(
-    "opts, exp_opts", [(None, ""), ("", ""), ("aa", "aa"), (["aa", "bb"], "aa bb")]
+    "photo, save, opts, exp_opts",
+    [
+        (None, True, None, []),
+        (None, False, "", ["-overwrite_original_in_place"]),
+        ("photo", True, "aa", ["aa"]),
+        ("photo", False, "aa", ["aa", "-overwrite_original_in_place"]),
+        (b"photo", True, ["aa", "bb"], ["aa", "bb"]),
+        (b"photo", False, ["aa", "bb"], ["aa", "bb", "-overwrite_original_in_place"]),
+    ],
 )
-@pytest.mark.parametrize("save", [True, False])
-@pytest.mark.parametrize("photo", [None, "photo", b"photo"])
 def test_exif_init(photo, save, opts, exp_opts):
     ed = pyexif.ExifEditor(photo=photo, save_backup=save, extra_opts=opts)
     assert ed.save_backup == save
-    if not save:
-        if exp_opts:
-            exp_opts = f"{exp_opts} -overwrite_original_in_place"
-        else:
-            exp_opts = "-overwrite_original_in_place"
     # pylint: disable=protected-access
-    assert ed._opt_expr == exp_opts
+    assert ed._opts == exp_opts
     exp_photo = photo.decode("utf-8") if isinstance(photo, bytes) else photo
     assert ed.photo == exp_photo
 
 
-def test_rotate_CCW(mocker):
-    ed = pyexif.ExifEditor()
-    mock_rotate = mocker.patch.object(ed, "_rotate")
+def test_rotate_CCW(mocker, ed):
+    mock_rotate = mocker.patch.object(pyexif.ExifEditor, "_rotate")
     ed.rotate_CCW()
     mock_rotate.assert_called_once_with(-90, False)
 
 
-def test_rotate_CW(mocker):
-    ed = pyexif.ExifEditor()
-    mock_rotate = mocker.patch.object(ed, "_rotate")
+def test_rotate_CW(mocker, ed):
+    mock_rotate = mocker.patch.object(pyexif.ExifEditor, "_rotate")
     ed.rotate_CW()
     mock_rotate.assert_called_once_with(90, False)
 
 
-def test_rotate_CCW_mult(mocker):
-    ed = pyexif.ExifEditor()
-    mock_rotate = mocker.patch.object(ed, "_rotate")
+def test_rotate_CCW_mult(mocker, ed):
+    mock_rotate = mocker.patch.object(pyexif.ExifEditor, "_rotate")
     num = random.randrange(1, 20)
     ed.rotate_CCW(num)
     mock_rotate.assert_called_once_with(-90 * num, False)
 
 
-def test_rotate_CW_mult(mocker):
-    ed = pyexif.ExifEditor()
-    mock_rotate = mocker.patch.object(ed, "_rotate")
+def test_rotate_CW_mult(mocker, ed):
+    mock_rotate = mocker.patch.object(pyexif.ExifEditor, "_rotate")
     num = random.randrange(1, 20)
     ed.rotate_CW(num)
     mock_rotate.assert_called_once_with(90 * num, False)
 
 
-def test_get_orientation(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_get_orientation(mocker, random_string_factory, ed):
     orient = random_string_factory()
-    mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([{"Orientation": orient}]))
+    mocker.patch.object(pyexif, "_runproc", return_value=_jresp({"Orientation": orient}))
     result = ed.get_orientation()
     assert result == orient
 
 
 @pytest.mark.parametrize("orient", [1, 2, 3, 4])
-def test_get_orientation_tag(mocker, orient):
-    ed = pyexif.ExifEditor()
-    mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([{"Orientation#": orient}]))
+def test_get_orientation_tag(mocker, orient, ed):
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=f"{orient}\n".encode("utf-8"))
     result = ed.get_orientation_tag()
     assert result == orient
+    # The single-tag hot path must use plain '-s3' output, not JSON, and skip trailer scanning
+    assert "-s3" in mock_run.call_args[0][0]
+    assert "-fast2" in mock_run.call_args[0][0]
+
+
+def test_fast_level_disabled(mocker, random_string_factory):
+    ed = pyexif.ExifEditor(photo=random_string_factory(), fast_level=0)
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=b"1\n")
+    ed.get_orientation_tag()
+    assert not any(arg.startswith("-fast") for arg in mock_run.call_args[0][0])
+
+
+def test_get_orientation_tag_missing(mocker, ed):
+    mocker.patch.object(pyexif, "_runproc", return_value=b"")
+    assert ed.get_orientation_tag() == 1
 
 
-def test_rotate(mocker):
-    ed = pyexif.ExifEditor()
-    mocker.patch.object(ed, "get_orientation_tag", return_value=1)
-    mocker.patch.object(ed, "set_orientation")
+def test_rotate(mocker, ed):
+    mocker.patch.object(pyexif.ExifEditor, "get_orientation_tag", return_value=1)
+    mocker.patch.object(pyexif.ExifEditor, "set_orientation")
     rot_values = {0: 1, 1: 6, 2: 3, 3: 8}
     # pylint: disable=protected-access
     for num in range(16):
@@ -124,33 +169,28 @@ def test_rotate(mocker):
 
 
 @pytest.mark.parametrize("degrees", [13, 46, 12345, -91])
-def test_rotate_bad_val(degrees):
-    ed = pyexif.ExifEditor()
+def test_rotate_bad_val(degrees, ed):
     # pylint: disable=protected-access
     with pytest.raises(ValueError, match="must be multiples of 90 degrees"):
         ed._rotate(degrees, True)
 
 
-@pytest.mark.parametrize(
-    "start, result", [(1, 2), (2, 1), (3, 4), (4, 3), (5, 6), (6, 5), (7, 8), (8, 7)]
-)
-def test_mirror_vertically(mocker, start, result):
-    ed = pyexif.ExifEditor()
-    mocker.patch.object(ed, "rotate_CW", return_value=start)
-    mock_set = mocker.patch.object(ed, "set_orientation")
-    ed.mirror_vertically()
-    mock_set.assert_called_once_with(result)
+def test_mirror_vertically(mocker, ed):
+    mock_get = mocker.patch.object(pyexif.ExifEditor, "get_orientation_tag")
+    mock_set = mocker.patch.object(pyexif.ExifEditor, "set_orientation")
+    for start, result in [(1, 4), (2, 3), (3, 2), (4, 1), (5, 8), (6, 7), (7, 6), (8, 5)]:
+        mock_get.return_value = start
+        ed.mirror_vertically()
+        assert mock_set.call_args_list[-1] == mocker.call(result)
 
 
-@pytest.mark.parametrize(
-    "start, result", [(1, 2), (2, 1), (3, 4), (4, 3), (5, 6), (6, 5), (7, 8), (8, 7)]
-)
-def test_mirror_horizontally(mocker, start, result):
-    ed = pyexif.ExifEditor()
-    mocker.patch.object(ed, "get_orientation_tag", return_value=start)
-    mock_set = mocker.patch.object(ed, "set_orientation")
-    ed.mirror_horizontally()
-    mock_set.assert_called_once_with(result)
+def test_mirror_horizontally(mocker, ed):
+    mock_get = mocker.patch.object(pyexif.ExifEditor, "get_orientation_tag")
+    mock_set = mocker.patch.object(pyexif.ExifEditor, "set_orientation")
+    for start, result in [(1, 2), (2, 1), (3, 4), (4, 3), (5, 6), (6, 5), (7, 8), (8, 7)]:
+        mock_get.return_value = start
+        ed.mirror_horizontally()
+        assert mock_set.call_args_list[-1] == mocker.call(result)
 
 
 def test_set_orientation(mocker, random_string_factory):
@@ -159,13 +199,12 @@ def test_set_orientation(mocker, random_string_factory):
     mock_run = mocker.patch.object(pyexif, "_runproc")
     val = random.randrange(1, 9)
     ed.set_orientation(val)
-    mock_run.assert_called_once_with(f"exiftool  -Orientation#='{val}' \"{photo}\" ", fpath=photo)
+    mock_run.assert_called_once_with(["exiftool", f"-Orientation#={val}", photo], fpath=photo)
 
 
-def test_add_keyword(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_add_keyword(mocker, random_string_factory, ed):
     kw = random_string_factory()
-    mock_kws = mocker.patch.object(ed, "add_keywords")
+    mock_kws = mocker.patch.object(pyexif.ExifEditor, "add_keywords")
     ed.add_keyword(kw)
     mock_kws.assert_called_once_with([kw])
 
@@ -179,57 +218,65 @@ def test_add_keywords(mocker, random_string_factory):
     ed.add_keywords([kw1, kw2])
     mock_run.assert_called_once_with(ANY, fpath=photo)
     call_args = mock_run.call_args[0][0]
-    assert "exiftool " in call_args
+    assert call_args[0] == "exiftool"
     assert f"-iptc:keywords+={kw1}" in call_args
     assert f"-iptc:keywords+={kw2}" in call_args
 
 
-def test_get_keywords(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_get_keywords(mocker, random_string_factory, ed):
     # Make the keywords sort in reverse
     kw1 = random_string_factory(prefix="ZZ")
     kw2 = random_string_factory(prefix="AA")
-    mocker.patch.object(ed, "get_tag", return_value=[kw1, kw2])
+    mocker.patch.object(pyexif.ExifEditor, "get_tag", return_value=[kw1, kw2])
     result = ed.get_keywords()
     assert result == [kw2, kw1]
+    # sort=False returns the keywords in tag order
+    assert ed.get_keywords(sort=False) == [kw1, kw2]
+    # limit selects the first keywords in sorted order
+    assert ed.get_keywords(limit=1) == [kw2]
 
 
 def test_set_keywords(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+    photo = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
     kw1 = random_string_factory()
     kw2 = random_string_factory()
-    mock_clear = mocker.patch.object(ed, "clear_keywords")
-    mock_add = mocker.patch.object(ed, "add_keywords")
+    mock_run = mocker.patch.object(pyexif, "_runproc")
     ed.set_keywords([kw1, kw2])
-    mock_clear.assert_called_once_with()
-    mock_add.assert_called_once_with([kw1, kw2])
+    # Clear and adds must be fused into one invocation
+    mock_run.assert_called_once_with(ANY, fpath=photo)
+    call_args = mock_run.call_args[0][0]
+    assert "-iptc:keywords=" in call_args
+    assert f"-iptc:keywords+={kw1}" in call_args
+    assert f"-iptc:keywords+={kw2}" in call_args
+    assert call_args.index("-iptc:keywords=") < call_args.index(f"-iptc:keywords+={kw1}")
 
 
-def test_clear_keywords(mocker):
-    ed = pyexif.ExifEditor()
-    mock_set = mocker.patch.object(ed, "set_tag")
+def test_clear_keywords(mocker, ed):
+    mock_set = mocker.patch.object(pyexif.ExifEditor, "set_tag")
     ed.clear_keywords()
     mock_set.assert_called_once_with("Keywords", "")
 
 
-def test_remove_keyword(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
-    mock_remove = mocker.patch.object(ed, "remove_keywords")
+def test_remove_keyword(mocker, random_string_factory, ed):
+    mock_remove = mocker.patch.object(pyexif.ExifEditor, "remove_keywords")
     kw = random_string_factory()
     ed.remove_keyword(kw)
     mock_remove.assert_called_once_with([kw])
 
 
 def test_remove_keywords(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
-    kw1 = random_string_factory()
-    kw2 = random_string_factory()
+    photo = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
     bad_kw1 = random_string_factory()
     bad_kw2 = random_string_factory()
-    mocker.patch.object(ed, "get_keywords", return_value=[kw1, bad_kw1, kw2, bad_kw2])
-    mock_set = mocker.patch.object(ed, "set_keywords")
+    mock_run = mocker.patch.object(pyexif, "_runproc")
     ed.remove_keywords([bad_kw1, bad_kw2])
-    mock_set.assert_called_once_with([kw1, kw2])
+    # The removal is done by exiftool itself in a single call; no read first
+    mock_run.assert_called_once_with(ANY, fpath=photo)
+    call_args = mock_run.call_args[0][0]
+    assert f"-iptc:keywords-={bad_kw1}" in call_args
+    assert f"-iptc:keywords-={bad_kw2}" in call_args
 
 
 def test_get_tag(mocker, random_string_factory):
@@ -238,11 +285,12 @@ def test_get_tag(mocker, random_string_factory):
     tag_val = random_string_factory()
     ed = pyexif.ExifEditor(photo=photo)
     resp_dict = {tag_name: tag_val}
-    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([resp_dict]))
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
     result = ed.get_tag(tag_name)
     assert result == tag_val
+    # A miss pulls the full dump once, so later reads of any tag are free
     mock_run.assert_called_once_with(
-        f'exiftool -j -d "%Y:%m:%d %H:%M:%S" -{tag_name} "{photo}" ', fpath=photo
+        ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", photo], fpath=photo
     )
 
 
@@ -254,14 +302,207 @@ def test_get_tag_default(mocker, random_string_factory):
     default = random_string_factory()
     ed = pyexif.ExifEditor(photo=photo)
     resp_dict = {tag_name: tag_val}
-    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([resp_dict]))
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
     result = ed.get_tag(bad_name, default=default)
     assert result == default
     mock_run.assert_called_once_with(
-        f'exiftool -j -d "%Y:%m:%d %H:%M:%S" -{bad_name} "{photo}" ', fpath=photo
+        ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", photo], fpath=photo
     )
 
 
+def test_pool_round_robin(mocker):
+    daemons = [MagicMock(), MagicMock(), MagicMock()]
+    mocker.patch.object(pyexif, "_ExifToolDaemon", side_effect=daemons)
+    pool = pyexif.ExifToolPool(n=3)
+    for _ in range(4):
+        pool.execute(["dummy"])
+    assert daemons[0].execute.call_count == 2
+    assert daemons[1].execute.call_count == 1
+    assert daemons[2].execute.call_count == 1
+
+
+def test_pool_map(mocker):
+    mocker.patch.object(pyexif, "_ExifToolDaemon", return_value=MagicMock())
+    pool = pyexif.ExifToolPool(n=2)
+    result = pool.map(str.upper, ["aa", "bb", "cc"])
+    assert result == ["AA", "BB", "CC"]
+
+
+def test_pool_context_manager(mocker):
+    daemons = [MagicMock(), MagicMock()]
+    mocker.patch.object(pyexif, "_ExifToolDaemon", side_effect=daemons)
+    with pyexif.ExifToolPool(n=2) as pool:
+        assert isinstance(pool, pyexif.ExifToolPool)
+    for daemon in daemons:
+        daemon.close.assert_called_once()
+
+
+def test_read_many_streaming(mocker, random_string_factory):
+    paths = [random_string_factory() for _ in range(2)]
+    records = [{"SourceFile": p, "Tag": f"val-{p}"} for p in paths]
+    mocker.patch.object(pyexif, "_runproc", return_value=json.dumps(records).encode("utf-8"))
+    fake_ijson = MagicMock()
+    fake_ijson.items = MagicMock(return_value=iter([dict(rec) for rec in records]))
+    mocker.patch.object(pyexif, "ijson", fake_ijson)
+    result = pyexif.read_many(paths)
+    assert set(result) == set(paths)
+    fake_ijson.items.assert_called_once()
+
+
+def test_read_parallel(mocker, random_string_factory):
+    paths = [random_string_factory() for _ in range(4)]
+    tag = random_string_factory()
+    # Run the shards in-process; the sharding and merging are what is under test
+    fake_pool = MagicMock()
+    fake_pool.__enter__.return_value.map.side_effect = lambda fn, shards: [fn(s) for s in shards]
+    pool_cls = mocker.patch.object(pyexif, "ProcessPoolExecutor", return_value=fake_pool)
+
+    def fake_run(cmd, fpath=None):
+        return json.dumps([{"SourceFile": p, tag: f"val-{p}"} for p in cmd[4:]]).encode("utf-8")
+
+    mocker.patch.object(pyexif, "_runproc", side_effect=fake_run)
+    result = pyexif.read_parallel(paths, n_workers=2)
+    assert set(result) == set(paths)
+    for path in paths:
+        assert result[path][tag] == f"val-{path}"
+    # Workers must drop the daemon a forking start method copies from the parent
+    # pylint: disable=protected-access
+    assert pool_cls.call_args.kwargs["initializer"] is pyexif._reset_worker_daemon
+
+
+def test_editor_read_many(mocker, random_string_factory):
+    paths = [random_string_factory() for _ in range(2)]
+    resp = {paths[0]: {random_string_factory(): random_string_factory()}}
+    mock_many = mocker.patch.object(pyexif, "read_many", return_value=resp)
+    assert pyexif.ExifEditor.read_many(paths) is resp
+    mock_many.assert_called_once_with(paths, tags=None, chunk=500)
+
+
+def test_parallel_get_tags(mocker, random_string_factory):
+    photos = [random_string_factory() for _ in range(3)]
+    tag = random_string_factory()
+
+    def fake_run(cmd, fpath=None):
+        return json.dumps([{"SourceFile": fpath, tag: f"val-{fpath}"}]).encode("utf-8")
+
+    mocker.patch.object(pyexif, "_runproc", side_effect=fake_run)
+    result = pyexif.parallel_get_tags(photos, workers=2)
+    assert set(result) == set(photos)
+    for photo in photos:
+        assert result[photo][tag] == f"val-{photo}"
+
+
+def test_editor_uses_pool(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag = random_string_factory()
+    val = random_string_factory()
+    pool = MagicMock()
+    pool.execute.return_value = (_jresp({tag: val}), b"")
+    ed = pyexif.ExifEditor(photo=photo, pool=pool)
+    assert ed.get_tag(tag) == val
+    pool.execute.assert_called_once()
+
+
+def test_get_tag_cached(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag_name = random_string_factory()
+    tag_val = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {tag_name: tag_val}
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    assert ed.get_tag(tag_name) == tag_val
+    assert ed.get_tag(tag_name) == tag_val
+    # The second read must be served from the cache
+    mock_run.assert_called_once()
+
+
+def test_get_tag_cache_invalidated_by_write(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag_name = random_string_factory()
+    tag_val = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {tag_name: tag_val}
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    ed.get_tag(tag_name)
+    ed.set_tag(tag_name, random_string_factory())
+    ed.get_tag(tag_name)
+    # Read, write, fresh read
+    assert mock_run.call_count == 3
+
+
+def test_editor_flyweight(random_string_factory):
+    photo = random_string_factory()
+    ed1 = pyexif.ExifEditor(photo=photo)
+    ed2 = pyexif.ExifEditor(photo=photo)
+    assert ed1 is ed2
+    # Different construction args get their own instance
+    assert pyexif.ExifEditor(photo=photo, save_backup=True) is not ed1
+    assert pyexif.ExifEditor(photo=random_string_factory()) is not ed1
+    pyexif.ExifEditor.clear_cache()
+    assert pyexif.ExifEditor(photo=photo) is not ed1
+
+
+def test_refresh(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag_name = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {tag_name: random_string_factory()}
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    ed.get_tag(tag_name)
+    ed.refresh()
+    ed.get_tag(tag_name)
+    # The refresh dropped the cache, so the second read re-runs exiftool
+    assert mock_run.call_count == 2
+
+
+def test_cache_invalidated_by_mtime(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag_name = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {tag_name: random_string_factory()}
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    mocker.patch.object(pyexif.os.path, "getmtime", side_effect=[1.0, 2.0, 2.0])
+    ed.get_tag(tag_name)
+    # The file changed on disk, so the cached values must be dropped
+    ed.get_tag(tag_name)
+    assert mock_run.call_count == 2
+
+
+def test_prefetch(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag1 = random_string_factory()
+    val1 = random_string_factory()
+    tag2 = random_string_factory()
+    val2 = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {"SourceFile": photo, tag1: val1, tag2: val2}
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    ed.prefetch([tag1, tag2])
+    assert ed.get_tag(tag1) == val1
+    assert ed.get_tag(tag2) == val2
+    mock_run.assert_called_once()
+    call_args = mock_run.call_args[0][0]
+    assert f"-{tag1}" in call_args
+    assert f"-{tag2}" in call_args
+
+
+def test_get_tag_streaming(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag_name = random_string_factory()
+    tag_val = random_string_factory()
+    other_name = random_string_factory()
+    ed = pyexif.ExifEditor(photo=photo)
+    resp_dict = {tag_name: tag_val, other_name: random_string_factory()}
+    mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
+    # Simulate an installed ijson; the dump should be parsed from the token stream
+    fake_ijson = MagicMock()
+    fake_ijson.kvitems = MagicMock(return_value=iter(resp_dict.items()))
+    mocker.patch.object(pyexif, "ijson", fake_ijson)
+    result = ed.get_tag(tag_name)
+    assert result == tag_val
+    fake_ijson.kvitems.assert_called_once()
+
+
 @pytest.mark.parametrize("include_empty", [True, False])
 @pytest.mark.parametrize("just_names", [True, False])
 def test_get_tags(mocker, random_string_factory, just_names, include_empty):
@@ -274,10 +515,12 @@ def test_get_tags(mocker, random_string_factory, just_names, include_empty):
     tag3 = random_string_factory(prefix="et3")
     val3 = random_string_factory(prefix="fv3")
     resp_dict = {tag1: val1, tag2: val2, tag3: val3}
-    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([resp_dict]))
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
     ed = pyexif.ExifEditor(photo=photo)
     result = ed.get_tags(just_names=just_names, include_empty=include_empty)
-    mock_run.assert_called_once_with(f'exiftool -j -d "%Y:%m:%d %H:%M:%S" "{photo}" ', fpath=photo)
+    mock_run.assert_called_once_with(
+        ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", photo], fpath=photo
+    )
     if just_names:
         if include_empty:
             assert result == [tag1, tag2, tag3]
@@ -301,10 +544,12 @@ def test_get_dict_tags(mocker, random_string_factory, include_empty):
     tag3 = random_string_factory(prefix="et3")
     val3 = random_string_factory(prefix="fv3")
     resp_dict = {tag1: val1, tag2: val2, tag3: val3}
-    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=json.dumps([resp_dict]))
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp(resp_dict))
     ed = pyexif.ExifEditor(photo=photo)
     result = ed.get_dict_tags(include_empty=include_empty)
-    mock_run.assert_called_once_with(f'exiftool -j -d "%Y:%m:%d %H:%M:%S" "{photo}" ', fpath=photo)
+    mock_run.assert_called_once_with(
+        ["exiftool", "-j", "-d", "%Y:%m:%d %H:%M:%S", photo], fpath=photo
+    )
     if include_empty:
         assert result == {tag1: val1, tag2: val2, tag3: val3}
     else:
@@ -321,11 +566,46 @@ def test_set_tags(mocker, random_string_factory):
     tag3 = random_string_factory(prefix="et3")
     val3 = random_string_factory(prefix="fv3")
     tag_dict = {tag1: val1, tag2: val2, tag3: val3}
-    mock_run = mocker.patch.object(pyexif, "_runproc")
+    mock_run = mocker.patch.object(pyexif, "_runproc", side_effect=[_jresp({}), None])
     ed = pyexif.ExifEditor(photo=photo)
     ed.set_tags(tag_dict)
-    exp_cmd = f'exiftool -overwrite_original_in_place -{tag1}="{val1}" -{tag2}="{val2}" -{tag3}="{val3}" "{photo}" '
-    mock_run.assert_called_once_with(exp_cmd, fpath=photo)
+    # One read of the current values, one write
+    assert mock_run.call_count == 2
+    exp_cmd = [
+        "exiftool",
+        "-overwrite_original_in_place",
+        f"-{tag1}={val1}",
+        f"-{tag2}={val2}",
+        f"-{tag3}={val3}",
+        photo,
+    ]
+    assert mock_run.call_args_list[1] == mocker.call(exp_cmd, fpath=photo)
+
+
+def test_set_tags_skips_unchanged(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag1 = random_string_factory()
+    val1 = random_string_factory()
+    tag2 = random_string_factory()
+    val2 = random_string_factory()
+    current = {tag1: random_string_factory(), tag2: val2}
+    mock_run = mocker.patch.object(pyexif, "_runproc", side_effect=[_jresp(current), None])
+    ed = pyexif.ExifEditor(photo=photo)
+    ed.set_tags({tag1: val1, tag2: val2})
+    write_cmd = mock_run.call_args_list[1][0][0]
+    assert f"-{tag1}={val1}" in write_cmd
+    assert f"-{tag2}={val2}" not in write_cmd
+
+
+def test_set_tags_all_unchanged(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag = random_string_factory()
+    val = random_string_factory()
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=_jresp({tag: val}))
+    ed = pyexif.ExifEditor(photo=photo)
+    ed.set_tags({tag: val})
+    # Only the read; no write, no file rewrite
+    mock_run.assert_called_once()
 
 
 def test_set_tag_bad_tag(capsys, mocker, random_string_factory):
@@ -362,44 +642,114 @@ def test_set_tags_bad_tag(capsys, mocker, random_string_factory):
     assert f"Tag '{tag}' is invalid." in out
 
 
-def test_get_original_date_time(mocker):
-    ed = pyexif.ExifEditor()
-    mock_get = mocker.patch.object(ed, "_get_date_time_field")
+def test_context_manager_batches(mocker, random_string_factory):
+    photo = random_string_factory()
+    tag = random_string_factory()
+    val = random_string_factory()
+    kw = random_string_factory()
+    mock_run = mocker.patch.object(pyexif, "_runproc")
+    with pyexif.ExifEditor(photo=photo) as ed:
+        ed.set_orientation(3)
+        ed.set_tag(tag, val)
+        ed.add_keyword(kw)
+        # Nothing is written until the block exits
+        mock_run.assert_not_called()
+    mock_run.assert_called_once_with(ANY, fpath=photo)
+    call_args = mock_run.call_args[0][0]
+    assert "-Orientation#=3" in call_args
+    assert f"-{tag}={val}" in call_args
+    assert f"-iptc:keywords+={kw}" in call_args
+
+
+def test_context_manager_discards_on_error(mocker, random_string_factory):
+    photo = random_string_factory()
+    mock_run = mocker.patch.object(pyexif, "_runproc")
+    with pytest.raises(ValueError):
+        with pyexif.ExifEditor(photo=photo) as ed:
+            ed.set_orientation(3)
+            raise ValueError("boom")
+    mock_run.assert_not_called()
+
+
+def test_read_many_single_call(mocker, random_string_factory):
+    photo1 = random_string_factory()
+    photo2 = random_string_factory()
+    tag = random_string_factory()
+    val1 = random_string_factory()
+    val2 = random_string_factory()
+    resp = [{"SourceFile": photo1, tag: val1}, {"SourceFile": photo2, tag: val2}]
+    mock_run = mocker.patch.object(
+        pyexif, "_runproc", return_value=json.dumps(resp).encode("utf-8")
+    )
+    result = pyexif.read_many([photo1, photo2], tags=[tag])
+    mock_run.assert_called_once()
+    call_args = mock_run.call_args[0][0]
+    assert f"-{tag}" in call_args
+    assert photo1 in call_args
+    assert photo2 in call_args
+    assert result == {photo1: {tag: val1}, photo2: {tag: val2}}
+
+
+def test_read_many_chunks(mocker, random_string_factory):
+    photos = [random_string_factory() for _ in range(5)]
+    mock_run = mocker.patch.object(pyexif, "_runproc", return_value=b"[]")
+    pyexif.read_many(photos, chunk=2)
+    assert mock_run.call_count == 3
+
+
+def test_write_many(mocker, random_string_factory):
+    photo1 = random_string_factory()
+    photo2 = random_string_factory()
+    tag = random_string_factory()
+    val = random_string_factory()
+    mock_run = mocker.patch.object(pyexif, "_runproc")
+    pyexif.write_many([photo1, photo2], {tag: val})
+    mock_run.assert_called_once()
+    call_args = mock_run.call_args[0][0]
+    assert "-overwrite_original_in_place" in call_args
+    assert f"-{tag}={val}" in call_args
+    assert photo1 in call_args
+    assert photo2 in call_args
+
+
+def test_write_many_bad_type(random_string_factory):
+    with pytest.raises(TypeError, match="is not instance of dict"):
+        pyexif.write_many([random_string_factory()], "not a dict")
+
+
+def test_get_original_date_time(mocker, ed):
+    mock_get = mocker.patch.object(pyexif.ExifEditor, "_get_date_time_field")
     ed.get_original_date_time()
     mock_get.assert_called_once_with("DateTimeOriginal")
 
 
-def test_set_original_date_time(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_set_original_date_time(mocker, random_string_factory, ed):
     dttm = random_string_factory()
-    mock_set = mocker.patch.object(ed, "_set_date_time_field")
+    mock_set = mocker.patch.object(pyexif.ExifEditor, "_set_date_time_field")
     ed.set_original_date_time(dttm)
     mock_set.assert_called_once_with("DateTimeOriginal", dttm)
 
 
-def test_get_modified_date_time(mocker):
-    ed = pyexif.ExifEditor()
-    mock_get = mocker.patch.object(ed, "_get_date_time_field")
+def test_get_modified_date_time(mocker, ed):
+    mock_get = mocker.patch.object(pyexif.ExifEditor, "_get_date_time_field")
     ed.get_modification_date_time()
     mock_get.assert_called_once_with("FileModifyDate")
 
 
-def test_set_modified_date_time(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_set_modified_date_time(mocker, random_string_factory, ed):
     dttm = random_string_factory()
-    mock_set = mocker.patch.object(ed, "_set_date_time_field")
+    mock_set = mocker.patch.object(pyexif.ExifEditor, "_set_date_time_field")
     ed.set_modification_date_time(dttm)
     mock_set.assert_called_once_with("FileModifyDate", dttm)
 
 
-def test_get_datetime_field(mocker, random_string_factory):
-    ed = pyexif.ExifEditor()
+def test_get_datetime_field(mocker, random_string_factory, ed):
     fld = random_string_factory()
     now = datetime.utcnow()
     # Need to trim the milliseconds
     exp_date = datetime(now.year, now.month, now.day, now.hour, now.minute, now.second)
     fmt_now = now.strftime("%Y:%m:%d %H:%M:%S")
-    mocker.patch.object(ed, "get_tag", return_value=fmt_now)
+    mocker.patch.object(pyexif.ExifEditor, "_get_tag_raw", return_value=fmt_now)
     # pylint: disable=protected-access
     result = ed._get_date_time_field(fld)
     assert result == exp_date
@@ -414,7 +764,7 @@ def test_set_datetime_field(mocker, random_string_factory):
     mock_run = mocker.patch.object(pyexif, "_runproc")
     # pylint: disable=protected-access
     ed._set_date_time_field(fld, now)
-    exp_cmd = f"""exiftool -overwrite_original_in_place -{fld}='{fmt_now}' "{photo}" """
+    exp_cmd = ["exiftool", "-overwrite_original_in_place", f"-{fld}={fmt_now}", photo]
     mock_run.assert_called_once_with(exp_cmd, fpath=photo)
 
 
@@ -427,14 +777,16 @@ def test_set_datetime_field(mocker, random_string_factory):
         ("1999:55:08", False),
         ("1999999:09:123", False),
         ("fred", False),
+        ("-199:09:08", False),
+        ("１９９９:09:08", False),
+        ("1999:09:08 ２１:44:33", False),
     ],
 )
-def test_format_date_time(dt_str, ok):
+def test_format_date_time(dt_str, ok, shared_ed):
     # pylint: disable=protected-access
-    ed = pyexif.ExifEditor()
     if not ok:
-        with pytest.raises(ValueError, match="Incorrect datetime value"):
-            ed._format_date_time(dt_str)
+        with pytest.raises(ValueError, match=_BAD_DT_RE):
+            shared_ed._format_date_time(dt_str)
     else:
         # No exception should be raised
-        ed._format_date_time(dt_str)
+        shared_ed._format_date_time(dt_str)